@@ -43,6 +43,12 @@ SDCARD_CTRL_RESPONSE_SHORT        = 1
 SDCARD_CTRL_RESPONSE_LONG         = 2
 SDCARD_CTRL_RESPONSE_SHORT_BUSY   = 3
 
+SDCARD_CMD_STOP_TRANSMISSION      = 12
+SDCARD_CMD_READ_SINGLE_BLOCK      = 17
+SDCARD_CMD_READ_MULTIPLE_BLOCK    = 18
+SDCARD_CMD_WRITE_SINGLE_BLOCK     = 24
+SDCARD_CMD_WRITE_MULTIPLE_BLOCK   = 25
+
 SDCARD_TUNING_BLOCK = [
     0xff0fff00, 0xffccc3cc, 0xc33cccff, 0xfefffeef,
     0xffdfffdd, 0xfffbfffb, 0xbfff7fff, 0x77f7bdef,
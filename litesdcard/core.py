@@ -8,6 +8,7 @@
 
 from migen import *
 from migen.genlib.cdc import MultiReg
+from migen.genlib.roundrobin import *
 
 from litex.gen import *
 
@@ -18,6 +19,40 @@ from litesdcard.common import *
 from litesdcard.crc import CRC
 from litesdcard.crc import CRC16Checker, CRC16Inserter
 
+# Layouts ------------------------------------------------------------------------------------------
+
+sdcore_cmd_layout = [
+    ("argument",     32),
+    ("cmd",           6),
+    ("cmd_type",      2),
+    ("data_type",     2),
+    ("block_length", 10),
+    ("block_count",  32),
+]
+
+sdcore_status_layout = [
+    ("response",    128),
+    ("cmd_error",     1),
+    ("cmd_timeout",   1),
+    ("data_error",    1),
+    ("data_timeout",  1),
+]
+
+# SDCore Port --------------------------------------------------------------------------------------
+
+class SDCorePort:
+    """SDCore hardware Port
+
+    Allows gateware to issue Cmd/Data transfers on the SDCore without CPU intervention. The Cmd
+    is presented on cmd and is acked once the Cmd/Data transfer has been executed; status is
+    then valid. Data is exchanged on sink/source while the port owns the SDCore.
+    """
+    def __init__(self):
+        self.cmd    = stream.Endpoint(sdcore_cmd_layout)
+        self.sink   = stream.Endpoint([("data", 8)])
+        self.source = stream.Endpoint([("data", 8)])
+        self.status = Record(sdcore_status_layout)
+
 # SDCore -------------------------------------------------------------------------------------------
 
 class SDCore(LiteXModule):
@@ -25,6 +60,7 @@ class SDCore(LiteXModule):
         self.sink   = stream.Endpoint([("data", 8)])
         self.source = stream.Endpoint([("data", 8)])
         self.irq = Signal()
+        self.ports = []
 
         # Cmd Registers.
         self.cmd_argument = CSRStorage(32, description="SDCard Cmd Argument.")
@@ -56,22 +92,37 @@ class SDCore(LiteXModule):
 
         # # #
 
+        # Port Selection ---------------------------------------------------------------------------
+        # Cmd/Data transfers are either driven from the CSRs or from one of the hardware ports (see
+        # get_port), hw_sel is latched at the start of each transfer to select the source. A Cmd sent
+        # from the CSRs is kept pending until the SDCore is idle and the granted port is not chaining
+        # Cmds (ex CMD18 + CMD12).
+        self.hw_cmd = hw_cmd = stream.Endpoint(sdcore_cmd_layout)
+        self.hw_sel = hw_sel = Signal()
+        self.hw_ack = hw_ack = Signal()
+        cmd_pending = Signal()
+        csr_start   = Signal()
+        self.sync += [
+            If(self.cmd_send.re,
+                cmd_pending.eq(1)
+            ).Elif(csr_start,
+                cmd_pending.eq(0)
+            )
+        ]
+
         # Register Mapping -------------------------------------------------------------------------
-        cmd_argument = self.cmd_argument.storage
-        cmd_command  = self.cmd_command.storage
-        cmd_send     = self.cmd_send.re
-        cmd_response = self.cmd_response.status
-        cmd_event    = self.cmd_event.status
-        data_event   = self.data_event.status
-        block_length = self.block_length.storage
-        block_count  = self.block_count.storage
+        cmd_argument = Mux(hw_sel, hw_cmd.argument,     self.cmd_argument.storage)
+        cmd_send     = cmd_pending & ~(hw_sel & hw_cmd.valid)
+        cmd_response = Signal(128)
+        block_length = Mux(hw_sel, hw_cmd.block_length, self.block_length.storage)
+        block_count  = Mux(hw_sel, hw_cmd.block_count,  self.block_count.storage)
 
         # CRC Inserter/Checkers --------------------------------------------------------------------
         self.crc7_inserter  = crc7_inserter  = CRC(polynom=0x9, taps=7, dw=40)
         self.crc16_inserter = crc16_inserter = CRC16Inserter()
         self.crc16_checker  = crc16_checker  = CRC16Checker()
-        self.comb += self.sink.connect(crc16_inserter.sink)
-        self.comb += crc16_checker.source.connect(self.source)
+        self.comb += If(~hw_sel, self.sink.connect(crc16_inserter.sink))
+        self.comb += If(~hw_sel, crc16_checker.source.connect(self.source))
 
         # Cmd/Data Signals -------------------------------------------------------------------------
         cmd_type     = Signal(2)
@@ -89,22 +140,16 @@ class SDCore(LiteXModule):
         cmd          = Signal(6)
 
         self.comb += [
-            # Decode type of Cmd/Data from Register.
-            cmd_type.eq(self.cmd_command.fields.cmd_type),
-            data_type.eq(self.cmd_command.fields.data_type),
-            cmd.eq(self.cmd_command.fields.cmd),
-
-            # Encode Cmd Event to Register.
-            self.cmd_event.fields.done.eq(cmd_done),
-            self.cmd_event.fields.error.eq(cmd_error),
-            self.cmd_event.fields.timeout.eq(cmd_timeout),
-            self.cmd_event.fields.crc.eq(0),
-
-            # Encode Data Event to Register.
-            self.data_event.fields.done.eq(data_done),
-            self.data_event.fields.error.eq(data_error),
-            self.data_event.fields.timeout.eq(data_timeout),
-            self.data_event.fields.crc.eq(0),
+            # Decode type of Cmd/Data from Register (or hardware port).
+            If(hw_sel,
+                cmd_type.eq(hw_cmd.cmd_type),
+                data_type.eq(hw_cmd.data_type),
+                cmd.eq(hw_cmd.cmd),
+            ).Else(
+                cmd_type.eq(self.cmd_command.fields.cmd_type),
+                data_type.eq(self.cmd_command.fields.data_type),
+                cmd.eq(self.cmd_command.fields.cmd),
+            ),
 
             # Prepare CRCInserter Data.
             crc7_inserter.din.eq(Cat(
@@ -116,10 +161,60 @@ class SDCore(LiteXModule):
             crc7_inserter.enable.eq(1),
         ]
 
-        # IRQ / Generate IRQ on CMD done rising edge
+        # Status to hardware ports.
+        self.status = Record(sdcore_status_layout)
+        self.comb += [
+            self.status.response.eq(cmd_response),
+            self.status.cmd_error.eq(cmd_error),
+            self.status.cmd_timeout.eq(cmd_timeout),
+            self.status.data_error.eq(data_error),
+            self.status.data_timeout.eq(data_timeout),
+        ]
+
+        # Events/Response to Registers: Cmds executed for the hardware ports are not visible from the
+        # CSRs (the results of the last Cmd issued from the CSRs are kept while a port owns the core).
+        csr_cmd_event  = Signal(3)
+        csr_data_event = Signal(3)
+        csr_response   = Signal(128)
+        self.sync += [
+            If(~hw_sel,
+                csr_cmd_event.eq(Cat(cmd_done, cmd_error, cmd_timeout)),
+                csr_data_event.eq(Cat(data_done, data_error, data_timeout)),
+                csr_response.eq(cmd_response),
+            )
+        ]
+        self.comb += [
+            # Encode Cmd Event to Register.
+            If(hw_sel,
+                Cat(self.cmd_event.fields.done,
+                    self.cmd_event.fields.error,
+                    self.cmd_event.fields.timeout).eq(csr_cmd_event),
+                Cat(self.data_event.fields.done,
+                    self.data_event.fields.error,
+                    self.data_event.fields.timeout).eq(csr_data_event),
+                self.cmd_response.status.eq(csr_response),
+            ).Else(
+                self.cmd_event.fields.done.eq(cmd_done),
+                self.cmd_event.fields.error.eq(cmd_error),
+                self.cmd_event.fields.timeout.eq(cmd_timeout),
+                self.data_event.fields.done.eq(data_done),
+                self.data_event.fields.error.eq(data_error),
+                self.data_event.fields.timeout.eq(data_timeout),
+                self.cmd_response.status.eq(cmd_response),
+            ),
+            # Cmd/Data are not done while a Cmd from the CSRs is pending.
+            If(cmd_pending,
+                self.cmd_event.fields.done.eq(0),
+                self.data_event.fields.done.eq(0),
+            ),
+            self.cmd_event.fields.crc.eq(0),
+            self.data_event.fields.crc.eq(0),
+        ]
+
+        # IRQ / Generate IRQ on CMD done rising edge (only for Cmds issued from the CSRs).
         done_d     = Signal()
-        self.sync += done_d.eq(cmd_done)
-        self.sync += self.irq.eq(cmd_done & ~done_d)
+        self.sync += done_d.eq(self.cmd_event.fields.done)
+        self.sync += self.irq.eq(self.cmd_event.fields.done & ~done_d)
 
         # Main FSM ---------------------------------------------------------------------------------
         self.fsm = fsm = FSM()
@@ -129,8 +224,15 @@ class SDCore(LiteXModule):
             NextValue(data_done,  1),
             NextValue(cmd_count,  0),
             NextValue(data_count, 0),
-            # Wait for a valid Cmd.
-            If(cmd_send,
+            # Ack hardware Cmd when executed.
+            If(hw_ack,
+                hw_cmd.ready.eq(1),
+                NextValue(hw_ack, 0),
+            # Wait for a valid Cmd (CSRs have priority over hardware ports, except during Cmd chains).
+            ).Elif(cmd_send | hw_cmd.valid,
+                csr_start.eq(cmd_send),
+                NextValue(hw_sel, ~cmd_send),
+                NextValue(hw_ack, ~cmd_send),
                 # Clear Cmd/Data Done/Error/Timeout.
                 NextValue(cmd_done,     0),
                 NextValue(cmd_error,    0),
@@ -259,3 +361,105 @@ class SDCore(LiteXModule):
                 )
             )
         )
+
+    def get_port(self):
+        """Return a new hardware Port on the SDCore (ports are arbitrated per Cmd)."""
+        port = SDCorePort()
+        self.ports.append(port)
+        return port
+
+    def do_finalize(self):
+        if len(self.ports) == 0:
+            return
+
+        # Arbitrate Cmds from the ports, grant is kept as long as the port keeps a Cmd valid (allows
+        # a port to chain Cmds, ex CMD18 + CMD12).
+        self.arbiter = arbiter = RoundRobin(len(self.ports), SP_CE)
+        self.comb += arbiter.request.eq(Cat(*[port.cmd.valid for port in self.ports]))
+        self.comb += arbiter.ce.eq(~self.hw_cmd.valid)
+
+        # Connect granted port to the SDCore (Data is only routed while a hardware Cmd is running).
+        cases = {}
+        for i, port in enumerate(self.ports):
+            self.comb += port.status.eq(self.status)
+            cases[i] = [
+                port.cmd.connect(self.hw_cmd),
+                If(self.hw_sel,
+                    port.sink.connect(self.crc16_inserter.sink),
+                    self.crc16_checker.source.connect(port.source),
+                )
+            ]
+        self.comb += Case(arbiter.grant, cases)
+
+# SD Block Transfer --------------------------------------------------------------------------------
+
+class SDBlockTransfer(LiteXModule):
+    """Block Transfer
+
+    Execute block read/write requests on a SDCore port: CMD17/CMD24 for single block transfers,
+    CMD18/CMD25 followed by CMD12 for multiple blocks transfers. The request is acked once executed,
+    error is then valid. LBA is passed as is to the SDCard (block addressing, SDHC/SDXC cards).
+    """
+    def __init__(self, port):
+        self.sink  = sink = stream.Endpoint([("write", 1), ("lba", 32), ("count", 32)])
+        self.error = Signal()
+
+        # # #
+
+        error  = Signal()
+        status = port.status
+        self.comb += self.error.eq(error)
+
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(sink.valid,
+                NextValue(error, 0),
+                If(sink.count == 0,
+                    NextState("DONE")
+                ).Else(
+                    NextState("CMD")
+                )
+            )
+        )
+        fsm.act("CMD",
+            port.cmd.valid.eq(1),
+            port.cmd.argument.eq(sink.lba),
+            port.cmd.cmd_type.eq(SDCARD_CTRL_RESPONSE_SHORT),
+            port.cmd.block_length.eq(512),
+            port.cmd.block_count.eq(sink.count),
+            If(sink.write,
+                port.cmd.data_type.eq(SDCARD_CTRL_DATA_TRANSFER_WRITE),
+                port.cmd.cmd.eq(Mux(sink.count == 1,
+                    SDCARD_CMD_WRITE_SINGLE_BLOCK,
+                    SDCARD_CMD_WRITE_MULTIPLE_BLOCK)),
+            ).Else(
+                port.cmd.data_type.eq(SDCARD_CTRL_DATA_TRANSFER_READ),
+                port.cmd.cmd.eq(Mux(sink.count == 1,
+                    SDCARD_CMD_READ_SINGLE_BLOCK,
+                    SDCARD_CMD_READ_MULTIPLE_BLOCK)),
+            ),
+            If(port.cmd.ready,
+                NextValue(error, status.cmd_timeout | status.data_timeout | status.data_error),
+                If(sink.count == 1,
+                    NextState("DONE")
+                ).Else(
+                    NextState("STOP")
+                )
+            )
+        )
+        fsm.act("STOP",
+            port.cmd.valid.eq(1),
+            port.cmd.cmd.eq(SDCARD_CMD_STOP_TRANSMISSION),
+            port.cmd.cmd_type.eq(SDCARD_CTRL_RESPONSE_SHORT_BUSY),
+            port.cmd.data_type.eq(SDCARD_CTRL_DATA_TRANSFER_NONE),
+            If(port.cmd.ready,
+                If(status.cmd_timeout,
+                    NextValue(error, 1)
+                ),
+                NextState("DONE")
+            )
+        )
+        fsm.act("DONE",
+            sink.ready.eq(1),
+            NextState("IDLE")
+        )
@@ -0,0 +1,212 @@
+#
+# This file is part of LiteSDCard.
+#
+# Copyright (c) 2026 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+from litesdcard.core import SDBlockTransfer
+
+# SD Block Port ------------------------------------------------------------------------------------
+
+class SDBlockPort:
+    """SD Block Port
+
+    Block request interface of the SDBlockArbiter: the request is presented on cmd and is acked
+    once all its blocks have been transferred; error is then valid. Data is exchanged on sink/source
+    (last on the final byte of each 512-byte block on writes).
+    """
+    def __init__(self):
+        self.cmd    = stream.Endpoint([("write", 1), ("lba", 32), ("count", 32)])
+        self.sink   = stream.Endpoint([("data", 8)])
+        self.source = stream.Endpoint([("data", 8)])
+        self.error  = Signal()
+
+# SD Block Arbiter ---------------------------------------------------------------------------------
+
+class SDBlockArbiter(LiteXModule):
+    """SD Block Arbiter
+
+    Share a SDCore between several block clients (see get_port) with priorities and bandwidth
+    reservations. Requests are split in chunks of at most max_blocks blocks and scheduled chunk per
+    chunk, so a long transfer never holds the SDCard for more than one chunk.
+
+    Each client has a priority and a token bucket: rate blocks are credited every period cycles (up
+    to burst blocks) and each transferred block consumes one credit. Clients with credits are served
+    first; among the selected clients the highest priority wins (lowest port on ties).
+    """
+    def __init__(self, core, max_blocks=8):
+        self.ports  = []
+        self.period = CSRStorage(32, reset=1024, description="Token buckets refill period (in cycles).")
+
+        # # #
+
+        self.max_blocks = max_blocks
+        self.port       = core.get_port()
+        self.transfer   = SDBlockTransfer(self.port)
+
+    def get_port(self, priority=0, rate=0, burst=0):
+        """Return a new client Port on the arbiter (priority/rate/burst are the CSRs reset values)."""
+        n    = len(self.ports)
+        port = SDBlockPort()
+        qos  = CSRStorage(fields=[
+            CSRField("priority", size=4, offset=0,  reset=priority, description="Client priority (higher is served first)."),
+            CSRField("rate",     size=8, offset=8,  reset=rate,     description="Blocks credited every period (0: no reservation)."),
+            CSRField("burst",    size=8, offset=16, reset=burst,    description="Max credited blocks."),
+        ], name=f"qos{n}")
+        setattr(self, f"qos{n}", qos)
+        port.qos = qos
+        self.ports.append(port)
+        return port
+
+    def do_finalize(self):
+        n        = len(self.ports)
+        transfer = self.transfer
+        assert n >= 1
+
+        # Refill Timer.
+        refill = Signal()
+        timer  = Signal(32)
+        self.sync += [
+            timer.eq(timer - 1),
+            If(timer == 0,
+                timer.eq(self.period.storage - 1)
+            )
+        ]
+        self.comb += refill.eq(timer == 0)
+
+        # Clients.
+        grant      = Signal(max=max(n, 2))
+        select     = Signal(max=max(n, 2))
+        selected   = Signal()
+        busy       = Signal()
+        blocks     = Signal(32)
+        lbas       = []
+        writes     = []
+        remainings = []
+        for i, port in enumerate(self.ports):
+            active    = Signal()
+            write     = Signal()
+            lba       = Signal(32)
+            remaining = Signal(32)
+            error     = Signal()
+            credits   = Signal(8)
+            granted   = busy & (grant == i)
+            done      = granted & transfer.sink.ready
+            lbas.append(lba)
+            writes.append(write)
+            remainings.append(remaining)
+            port.active  = active
+            port.credits = credits
+
+            # Latch request / ack it when all its blocks have been transferred.
+            self.comb += [
+                port.error.eq(error),
+                port.cmd.ready.eq(active & (remaining == 0) & ~granted),
+            ]
+            self.sync += [
+                If(port.cmd.valid & port.cmd.ready,
+                    active.eq(0)
+                ).Elif(port.cmd.valid & ~active,
+                    active.eq(1),
+                    write.eq(port.cmd.write),
+                    lba.eq(port.cmd.lba),
+                    remaining.eq(port.cmd.count),
+                    error.eq(0),
+                ).Elif(done,
+                    lba.eq(lba + blocks),
+                    remaining.eq(remaining - blocks),
+                    # Stop the request on error.
+                    If(transfer.error,
+                        remaining.eq(0),
+                        error.eq(1)
+                    )
+                )
+            ]
+
+            # Token bucket.
+            self.sync += [
+                If(refill,
+                    If((credits + port.qos.fields.rate) > port.qos.fields.burst,
+                        credits.eq(port.qos.fields.burst)
+                    ).Else(
+                        credits.eq(credits + port.qos.fields.rate)
+                    )
+                ).Elif(done,
+                    If(credits > blocks,
+                        credits.eq(credits - blocks)
+                    ).Else(
+                        credits.eq(0)
+                    )
+                )
+            ]
+
+        # Scheduler: select the pending client with the highest (credits != 0, priority) key (the
+        # lowest port wins ties).
+        prev_selected = 0
+        prev_select   = 0
+        prev_key      = 0
+        for i, port in enumerate(self.ports):
+            pending   = Signal()
+            key       = Signal(5)
+            _selected = Signal()
+            _select   = Signal(max=max(n, 2))
+            _key      = Signal(5)
+            self.comb += [
+                pending.eq(port.active & (remainings[i] != 0)),
+                key.eq(Cat(port.qos.fields.priority, port.credits != 0)),
+                If(pending & (~prev_selected | (key > prev_key)),
+                    _selected.eq(1),
+                    _select.eq(i),
+                    _key.eq(key),
+                ).Else(
+                    _selected.eq(prev_selected),
+                    _select.eq(prev_select),
+                    _key.eq(prev_key),
+                )
+            ]
+            prev_selected, prev_select, prev_key = _selected, _select, _key
+        self.comb += [
+            selected.eq(prev_selected),
+            select.eq(prev_select),
+        ]
+
+        # Chunk size.
+        remaining = Signal(32)
+        self.comb += [
+            remaining.eq(Array(remainings)[grant]),
+            blocks.eq(Mux(remaining > self.max_blocks, self.max_blocks, remaining)),
+        ]
+
+        # Transfer Control.
+        self.sync += [
+            If(~busy,
+                If(selected,
+                    busy.eq(1),
+                    grant.eq(select)
+                )
+            ).Elif(transfer.sink.ready,
+                busy.eq(0)
+            )
+        ]
+        self.comb += [
+            transfer.sink.valid.eq(busy),
+            transfer.sink.write.eq(Array(writes)[grant]),
+            transfer.sink.lba.eq(Array(lbas)[grant]),
+            transfer.sink.count.eq(blocks),
+        ]
+
+        # Data path.
+        cases = {}
+        for i, port in enumerate(self.ports):
+            cases[i] = [
+                port.sink.connect(self.port.sink),
+                self.port.source.connect(port.source),
+            ]
+        self.comb += If(busy, Case(grant, cases))
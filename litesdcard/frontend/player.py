@@ -0,0 +1,180 @@
+#
+# This file is part of LiteSDCard.
+#
+# Copyright (c) 2026 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+from litesdcard.core import SDBlockTransfer
+
+# SD Stream Player ---------------------------------------------------------------------------------
+
+class SDStreamPlayer(LiteXModule):
+    """SDCard to Stream Player
+
+    Read a LBA range from the SDCard (through CMD18) and play it on a stream without CPU
+    intervention. Blocks are prefetched in a FIFO to hide SDCard access latency, reads are issued
+    in chunks of at most half the FIFO (double buffering) and only when the FIFO can absorb them.
+    The range can be played once or looped and the output rate can be limited. last is set on the
+    final byte of each pass.
+
+    stop (or a read error) lets the in-flight read complete and then flushes the FIFO; start also
+    flushes the FIFO so that a new run never plays stale bytes.
+    """
+    def __init__(self, core, fifo_depth=4096, max_blocks=256):
+        assert fifo_depth >= 1024
+        self.source = source = stream.Endpoint([("data", 8)])
+
+        self.start  = CSR()
+        self.stop   = CSR()
+        self.lba    = CSRStorage(32, description="First LBA of the range.")
+        self.count  = CSRStorage(32, description="Number of blocks of the range.")
+        self.loop   = CSRStorage(description="Loop on the range until stopped.")
+        self.period = CSRStorage(32, description="Min number of cycles between output bytes (0: unlimited).")
+        self.status = CSRStatus(fields=[
+            CSRField("running", size=1, offset=0, description="Player is running."),
+            CSRField("error",   size=1, offset=1, description="A SDCard read has failed (player stopped)."),
+        ])
+        self.passes = CSRStatus(32, description="Number of completed passes.")
+
+        # # #
+
+        # Submodules.
+        port     = core.get_port()
+        transfer = SDBlockTransfer(port)
+        fifo     = ResetInserter()(stream.SyncFIFO([("data", 8)], fifo_depth, buffered=True))
+        self.submodules += transfer, fifo
+        self.comb += port.source.connect(fifo.sink, omit={"first", "last"})
+
+        # Prefetch Control.
+        chunk     = min(max_blocks, fifo_depth//(2*512))
+        running   = Signal()
+        stop      = Signal()
+        error     = Signal()
+        issue     = Signal()
+        flush     = Signal()
+        lba       = Signal(32)
+        remaining = Signal(32)
+        blocks    = Signal(32)
+        first     = Signal(32)                 # First LBA of the range (latched on start).
+        count     = Signal(32)                 # Blocks of the range (latched on start).
+        pending   = Signal(max=fifo_depth + 1) # Bytes requested and not yet written to the FIFO.
+        self.comb += [
+            self.status.fields.running.eq(running),
+            self.status.fields.error.eq(error),
+            blocks.eq(Mux(remaining > chunk, chunk, remaining)),
+            fifo.reset.eq(flush),
+        ]
+        self.sync += [
+            If(flush,
+                pending.eq(0)
+            ).Else(
+                pending.eq(pending + Mux(issue, blocks*512, 0) - (port.source.valid & port.source.ready))
+            ),
+            If(self.stop.re,
+                stop.eq(1)
+            ).Elif(self.start.re,
+                stop.eq(0)
+            )
+        ]
+
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(self.start.re,
+                flush.eq(1),
+                NextValue(running, 1),
+                NextValue(first,   self.lba.storage),
+                NextValue(count,   self.count.storage),
+                NextValue(error,   0),
+                NextValue(self.passes.status, 0),
+                NextState("RELOAD")
+            ).Elif(self.stop.re,
+                flush.eq(1)
+            )
+        )
+        fsm.act("RELOAD",
+            NextValue(lba,       first),
+            NextValue(remaining, count),
+            If(stop | (count == 0),
+                NextState("FLUSH")
+            ).Else(
+                NextState("WAIT")
+            )
+        )
+        fsm.act("WAIT",
+            # Only read when the FIFO has room for the whole chunk.
+            If(stop,
+                NextState("FLUSH")
+            ).Elif((fifo_depth - fifo.level - pending) >= blocks*512,
+                issue.eq(1),
+                NextState("READ")
+            )
+        )
+        fsm.act("READ",
+            transfer.sink.valid.eq(1),
+            transfer.sink.write.eq(0),
+            transfer.sink.lba.eq(lba),
+            transfer.sink.count.eq(blocks),
+            If(transfer.sink.ready,
+                NextValue(lba,       lba       + blocks),
+                NextValue(remaining, remaining - blocks),
+                # On error, stop the player (the partially received chunk is discarded).
+                If(transfer.error,
+                    NextValue(error, 1),
+                    NextState("FLUSH")
+                ).Elif(stop,
+                    NextState("FLUSH")
+                ).Elif(remaining == blocks,
+                    NextValue(self.passes.status, self.passes.status + 1),
+                    If(self.loop.storage,
+                        NextState("RELOAD")
+                    ).Else(
+                        NextValue(running, 0),
+                        NextState("IDLE")
+                    )
+                ).Else(
+                    NextState("WAIT")
+                )
+            )
+        )
+        fsm.act("FLUSH",
+            flush.eq(1),
+            NextValue(running, 0),
+            NextState("IDLE")
+        )
+
+        # Output / Pass delimiter.
+        bytes_count = Signal(41)
+        self.sync += [
+            If(source.valid & source.ready,
+                bytes_count.eq(bytes_count + 1),
+                If(source.last,
+                    bytes_count.eq(0)
+                )
+            ),
+            If(flush,
+                bytes_count.eq(0)
+            )
+        ]
+
+        # Output / Rate limiting.
+        timer = Signal(32)
+        self.sync += [
+            If(source.valid & source.ready,
+                timer.eq(self.period.storage)
+            ).Elif(timer != 0,
+                timer.eq(timer - 1)
+            )
+        ]
+        self.comb += [
+            If((timer == 0) & ~flush,
+                fifo.source.connect(source, omit={"last"}),
+                source.last.eq(bytes_count == (count*512 - 1)),
+            )
+        ]
@@ -0,0 +1,226 @@
+#
+# This file is part of LiteSDCard.
+#
+# Copyright (c) 2026 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+from litesdcard.phy import SDPHY
+from litesdcard.core import SDCore, SDBlockTransfer
+
+# SD Striping Core ---------------------------------------------------------------------------------
+
+class SDStripingCore(LiteXModule):
+    """Striping Core
+
+    Stripe a logical LBA space across N SDCards (RAID-0, 1 block stripe unit) from their PHYs:
+    logical block b is stored on card b % N at LBA b // N. A transfer is split in N concurrent
+    multiple blocks transfers; blocks are fanned out to the cards from sink on writes and gathered
+    back in order on source on reads.
+
+    Each card has its own FIFO so that temporary speed differences between the cards (ex write
+    busy) are absorbed; sustained bandwidth is the one of the slowest card times N.
+
+    A per-card error (or a write to abort) aborts the transfer: no more data is exchanged on
+    sink/source, reads still running on the other cards are discarded and writes still running are
+    completed with zeroed blocks (SDCards can't stop a multiple blocks write mid-block). done is set
+    once all cards are idle.
+
+    Cards are initialized by software through the CSRs of each PHY/Core; the data path of the Core
+    selected by sel is connected to sink/source when no striped transfer is running. irq is the OR
+    of the striped transfer done IRQ and of the IRQs of the Cores.
+    """
+    def __init__(self, phys, fifo_depth=2048):
+        n = len(phys)
+        assert n >= 2 and (n & (n - 1)) == 0
+        assert fifo_depth >= 512
+        nbits = log2_int(n)
+        self.sink   = sink   = stream.Endpoint([("data", 8)])
+        self.source = source = stream.Endpoint([("data", 8)])
+        self.irq    = Signal()
+
+        self.sel    = CSRStorage(nbits, description="Card connected to sink/source when idle.")
+        self.lba    = CSRStorage(32, description="First logical LBA of the transfer.")
+        self.count  = CSRStorage(32, description="Number of logical blocks of the transfer.")
+        self.write  = CSRStorage(description="Transfer direction (0: Read, 1: Write).")
+        self.start  = CSR()
+        self.abort  = CSR()
+        self.status = CSRStatus(fields=[
+            CSRField("done",  size=1, offset=0, description="Transfer has been executed."),
+            CSRField("error", size=1, offset=1, description="Transfer has failed on at least one card (or has been aborted)."),
+        ])
+        self.busy   = CSRStatus(n, description="Per-card transfer running.")
+        self.errors = CSRStatus(n, description="Per-card transfer error.")
+
+        # # #
+
+        lba      = Signal(32)
+        count    = Signal(32)
+        write    = Signal()
+        running  = Signal()
+        aborted  = Signal()
+        start    = Signal()
+        done_d   = Signal()
+        done_irq = Signal()
+        self.comb += [
+            start.eq(self.start.re & ~running),
+            self.status.fields.done.eq(~running),
+            self.status.fields.error.eq(aborted),
+        ]
+        self.sync += done_d.eq(running)
+        self.sync += done_irq.eq(~running & done_d)
+
+        # Cards ------------------------------------------------------------------------------------
+        done_cards = Signal(n)
+        fifos      = []
+        irqs       = []
+        for i, phy in enumerate(phys):
+            core = SDCore(phy)
+            port = core.get_port()
+            setattr(self, f"phy{i}",  phy)
+            setattr(self, f"core{i}", core)
+            irqs.append(core.irq)
+
+            # Per-card share of the transfer.
+            offset = Signal(nbits)
+            blocks = Signal(32)
+            self.comb += [
+                offset.eq(i - lba[:nbits]),
+                If(count > offset,
+                    blocks.eq(((count - offset - 1) >> nbits) + 1)
+                )
+            ]
+
+            # Per-card transfer.
+            transfer = SDBlockTransfer(port)
+            self.submodules += transfer
+            self.comb += [
+                transfer.sink.valid.eq(running & ~done_cards[i]),
+                transfer.sink.write.eq(write),
+                transfer.sink.lba.eq((lba + offset) >> nbits),
+                transfer.sink.count.eq(blocks),
+            ]
+            self.sync += [
+                If(start,
+                    done_cards[i].eq(0),
+                    self.errors.status[i].eq(0)
+                ).Elif(transfer.sink.valid & transfer.sink.ready,
+                    done_cards[i].eq(1),
+                    self.errors.status[i].eq(transfer.error)
+                )
+            ]
+
+            # Per-card FIFO (towards the card on writes, from the card on reads), reset on start.
+            fifo = ResetInserter()(stream.SyncFIFO([("data", 8)], fifo_depth, buffered=True))
+            self.submodules += fifo
+            fifos.append(fifo)
+            self.comb += fifo.reset.eq(start)
+
+            # Byte position in the block written to the card (to pad aborted writes).
+            wbyte = Signal(9)
+            self.sync += [
+                If(start,
+                    wbyte.eq(0)
+                ).Elif(port.sink.valid & port.sink.ready,
+                    wbyte.eq(wbyte + 1)
+                )
+            ]
+            self.comb += [
+                If(write,
+                    If(aborted & done_cards[i],
+                        # Discard.
+                        fifo.source.ready.eq(1)
+                    ).Elif(aborted & ~fifo.source.valid,
+                        # Pad.
+                        port.sink.valid.eq(1),
+                        port.sink.last.eq(wbyte == (512 - 1)),
+                    ).Else(
+                        fifo.source.connect(port.sink)
+                    )
+                ).Else(
+                    port.source.connect(fifo.sink, omit={"first", "last"}),
+                    # Discard.
+                    If(aborted,
+                        fifo.source.ready.eq(1)
+                    )
+                )
+            ]
+
+            # CSR data path (card initialization).
+            self.comb += [
+                If(~running & (self.sel.storage == i),
+                    sink.connect(core.sink),
+                    core.source.connect(source),
+                )
+            ]
+        self.comb += self.busy.status.eq(Replicate(running, n) & ~done_cards)
+        self.comb += self.irq.eq(done_irq | (Cat(*irqs) != 0))
+
+        # Control ----------------------------------------------------------------------------------
+        remaining = Signal(32) # Logical blocks not yet exchanged on sink/source.
+        self.sync += [
+            If(start,
+                running.eq(1),
+                aborted.eq(0),
+                lba.eq(self.lba.storage),
+                count.eq(self.count.storage),
+                write.eq(self.write.storage),
+            ).Elif((done_cards == (2**n - 1)) & ((remaining == 0) | aborted),
+                running.eq(0)
+            ),
+            If(running & (self.abort.re | (self.errors.status != 0)),
+                aborted.eq(1)
+            )
+        ]
+
+        # Fan-out/Gather ---------------------------------------------------------------------------
+        # Blocks are exchanged with the cards in logical order, starting with card lba % N.
+        card = Signal(nbits)
+        byte = Signal(9)
+        self.sync += [
+            If(start,
+                card.eq(self.lba.storage[:nbits]),
+                byte.eq(0),
+                remaining.eq(self.count.storage),
+            ).Elif((sink.valid & sink.ready) | (source.valid & source.ready),
+                If(running,
+                    byte.eq(byte + 1),
+                    If(byte == (512 - 1),
+                        card.eq(card + 1),
+                        remaining.eq(remaining - 1)
+                    )
+                )
+            )
+        ]
+        cases = {}
+        for i, fifo in enumerate(fifos):
+            cases[i] = [
+                If(write,
+                    sink.connect(fifo.sink, omit={"last"}),
+                    fifo.sink.last.eq(byte == (512 - 1)),
+                ).Else(
+                    fifo.source.connect(source, omit={"first", "last"}),
+                    source.first.eq(byte == 0),
+                    source.last.eq(byte == (512 - 1)),
+                )
+            ]
+        self.comb += If(running & ~aborted & (remaining != 0), Case(card, cases))
+
+# SD Striping Controller ---------------------------------------------------------------------------
+
+class SDStripingController(SDStripingCore):
+    """Striping Controller
+
+    SDStripingCore with its N SDPHYs, instantiated from a list of SDCard pads.
+    """
+    def __init__(self, pads_list, device, sys_clk_freq, cmd_timeout=10e-3, data_timeout=10e-3,
+        fifo_depth=2048):
+        phys = [SDPHY(pads, device, sys_clk_freq, cmd_timeout=cmd_timeout, data_timeout=data_timeout)
+            for pads in pads_list]
+        SDStripingCore.__init__(self, phys, fifo_depth=fifo_depth)
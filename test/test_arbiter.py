@@ -0,0 +1,87 @@
+#
+# This file is part of LiteSDCard.
+#
+# Copyright (c) 2026 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litex.gen import *
+
+from litesdcard.core import SDCore
+from litesdcard.frontend.arbiter import SDBlockArbiter
+
+from test.test_core import StubPHY, cmdw_generator, cmdr_generator, datar_generator, port_generator
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self, qos):
+        self.phy     = StubPHY()
+        self.core    = SDCore(self.phy)
+        self.arbiter = SDBlockArbiter(self.core, max_blocks=1)
+        self.clients = [self.arbiter.get_port(**kwargs) for kwargs in qos]
+
+# Test Arbiter -------------------------------------------------------------------------------------
+
+def request_generator(port, lba, count, delay, results, timeout_cycles=8192):
+    for i in range(delay):
+        yield
+    yield port.cmd.valid.eq(1)
+    yield port.cmd.lba.eq(lba)
+    yield port.cmd.count.eq(count)
+    yield
+    for i in range(timeout_cycles):
+        if (yield port.cmd.ready):
+            break
+        yield
+    else:
+        raise TimeoutError("Block request not acked.")
+    results.append((yield port.error))
+    yield port.cmd.valid.eq(0)
+    yield
+
+
+class TestArbiter(unittest.TestCase):
+    def arbiter_test(self, qos, requests, period=1024):
+        cmds    = []
+        args    = []
+        data    = [[] for i in range(len(qos))]
+        results = [[] for i in range(len(qos))]
+        dut = DUT(qos)
+        dut.arbiter.period.storage.reset = period
+        generators = [
+            cmdw_generator(dut.phy, cmds, args),
+            cmdr_generator(dut.phy),
+            datar_generator(dut.phy),
+        ]
+        for i, (lba, count, delay) in enumerate(requests):
+            generators += [
+                request_generator(dut.clients[i], lba, count, delay, results[i]),
+                port_generator(dut.clients[i], data[i]),
+            ]
+        run_simulation(dut, generators)
+        return args, data, results
+
+    def test_priority(self):
+        # Long low-priority request is interleaved with the high-priority one at chunk boundaries.
+        args, data, results = self.arbiter_test(
+            qos      = [dict(priority=0), dict(priority=1)],
+            requests = [(0x100, 2, 0), (0x200, 1, 16)],
+        )
+        self.assertEqual(args, [0x100, 0x200, 0x101])
+        self.assertEqual(len(data[0]), 2*512)
+        self.assertEqual(len(data[1]), 1*512)
+        self.assertEqual(results, [[0], [0]])
+
+    def test_reservation(self):
+        # Low-priority client with a reservation is served first.
+        args, data, results = self.arbiter_test(
+            qos      = [dict(priority=0, rate=1, burst=1), dict(priority=1)],
+            requests = [(0x100, 1, 32), (0x200, 1, 32)],
+            period   = 8,
+        )
+        self.assertEqual(args, [0x100, 0x200])
+        self.assertEqual(results, [[0], [0]])
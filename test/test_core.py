@@ -0,0 +1,187 @@
+#
+# This file is part of LiteSDCard.
+#
+# Copyright (c) 2026 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+from migen.sim import passive
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+
+from litesdcard.common import *
+from litesdcard.core import *
+
+# Stub PHY -----------------------------------------------------------------------------------------
+
+class _StubPHYPath:
+    def __init__(self, sink_layout, source_layout=None):
+        self.sink = stream.Endpoint(sink_layout)
+        if source_layout is not None:
+            self.source = stream.Endpoint(source_layout)
+
+
+class StubPHY(LiteXModule):
+    def __init__(self):
+        self.cmdw  = _StubPHYPath([("data", 8), ("cmd_type", 2)])
+        self.cmdr  = _StubPHYPath([("cmd_type", 2), ("data_type", 2), ("length", 8)], [("data", 8), ("status", 3)])
+        self.dataw = _StubPHYPath([("data", 8)])
+        self.datar = _StubPHYPath([("block_length", 10)], [("data", 8), ("status", 3)])
+        self.dummy = Signal() # Allow simulation of a Module without logic.
+        self.sync += self.dummy.eq(~self.dummy)
+
+
+class DUT(LiteXModule):
+    def __init__(self):
+        self.phy  = StubPHY()
+        self.core = SDCore(self.phy)
+        self.port = self.core.get_port()
+        self.transfer = SDBlockTransfer(self.port)
+
+# Stub PHY Generators ------------------------------------------------------------------------------
+
+@passive
+def cmdw_generator(phy, cmds, args=None):
+    yield phy.cmdw.sink.ready.eq(1)
+    data = []
+    while True:
+        if (yield phy.cmdw.sink.valid):
+            data.append((yield phy.cmdw.sink.data))
+            if (yield phy.cmdw.sink.last):
+                cmds.append(data[0] & 0x3f)
+                if args is not None:
+                    args.append(int.from_bytes(bytes(data[1:5]), "big"))
+                data = []
+        yield
+
+@passive
+def cmdr_generator(phy):
+    while True:
+        if (yield phy.cmdr.sink.valid):
+            length = (yield phy.cmdr.sink.length)
+            for i in range(length):
+                yield phy.cmdr.source.valid.eq(1)
+                yield phy.cmdr.source.last.eq(i == (length - 1))
+                yield phy.cmdr.source.data.eq(i)
+                yield phy.cmdr.source.status.eq(SDCARD_STREAM_STATUS_OK)
+                yield
+                while not (yield phy.cmdr.source.ready):
+                    yield
+            yield phy.cmdr.source.valid.eq(0)
+            while (yield phy.cmdr.sink.valid):
+                yield
+        yield
+
+@passive
+def datar_generator(phy, timeout=False, pattern=lambda block, i: (block + i) & 0xff):
+    block = 0
+    while True:
+        if (yield phy.datar.sink.valid):
+            if timeout:
+                data   = [0]
+                status = SDCARD_STREAM_STATUS_TIMEOUT
+            else:
+                data   = [pattern(block, i) for i in range(512)] + [0]*8 # Data + CRC16s.
+                status = SDCARD_STREAM_STATUS_OK
+            for i, d in enumerate(data):
+                yield phy.datar.source.valid.eq(1)
+                yield phy.datar.source.last.eq(i == (len(data) - 1))
+                yield phy.datar.source.data.eq(d)
+                yield phy.datar.source.status.eq(status)
+                yield
+                while not (yield phy.datar.source.ready):
+                    yield
+            yield phy.datar.source.valid.eq(0)
+            yield
+            block += 1
+        yield
+
+@passive
+def dataw_generator(phy, data):
+    yield phy.dataw.sink.ready.eq(1)
+    block = []
+    while True:
+        if (yield phy.dataw.sink.valid):
+            block.append((yield phy.dataw.sink.data))
+            if (yield phy.dataw.sink.last):
+                data += block[:-8] # Strip CRC16s.
+                block = []
+        yield
+
+@passive
+def port_generator(port, data):
+    yield port.source.ready.eq(1)
+    while True:
+        if (yield port.source.valid):
+            data.append((yield port.source.data))
+        yield
+
+# Test Core ----------------------------------------------------------------------------------------
+
+class TestCore(unittest.TestCase):
+    def block_transfer_test(self, count, timeout=False, csr_cmd=None, timeout_cycles=4096):
+        cmds = []
+        data = []
+        results = {}
+        def main_generator(dut):
+            yield dut.transfer.sink.valid.eq(1)
+            yield dut.transfer.sink.write.eq(0)
+            yield dut.transfer.sink.lba.eq(0x1234)
+            yield dut.transfer.sink.count.eq(count)
+            for i in range(4):
+                yield
+            # Send a Cmd from the CSRs while the port owns the SDCore.
+            if csr_cmd is not None:
+                yield dut.core.cmd_command.fields.cmd.eq(csr_cmd)
+                yield dut.core.cmd_send.re.eq(1)
+                yield
+                yield dut.core.cmd_send.re.eq(0)
+            for i in range(timeout_cycles):
+                if (yield dut.transfer.sink.ready):
+                    break
+                yield
+            else:
+                raise TimeoutError("Block transfer not acked.")
+            results["error"] = (yield dut.transfer.error)
+            yield dut.transfer.sink.valid.eq(0)
+            for i in range(64):
+                yield
+            results["csr_done"] = (yield dut.core.cmd_event.fields.done)
+
+        dut = DUT()
+        generators = [
+            main_generator(dut),
+            cmdw_generator(dut.phy, cmds),
+            cmdr_generator(dut.phy),
+            datar_generator(dut.phy, timeout=timeout),
+            port_generator(dut.port, data),
+        ]
+        run_simulation(dut, generators)
+        return cmds, data, results
+
+    def test_single_block_read(self):
+        cmds, data, results = self.block_transfer_test(count=1)
+        self.assertEqual(cmds, [SDCARD_CMD_READ_SINGLE_BLOCK])
+        self.assertEqual(data, [i & 0xff for i in range(512)])
+        self.assertEqual(results["error"], 0)
+
+    def test_multiple_block_read(self):
+        cmds, data, results = self.block_transfer_test(count=2)
+        self.assertEqual(cmds, [SDCARD_CMD_READ_MULTIPLE_BLOCK, SDCARD_CMD_STOP_TRANSMISSION])
+        self.assertEqual(len(data), 2*512)
+        self.assertEqual(results["error"], 0)
+
+    def test_multiple_block_read_timeout(self):
+        cmds, data, results = self.block_transfer_test(count=2, timeout=True)
+        self.assertEqual(cmds, [SDCARD_CMD_READ_MULTIPLE_BLOCK, SDCARD_CMD_STOP_TRANSMISSION])
+        self.assertEqual(data, [])
+        self.assertEqual(results["error"], 1)
+
+    def test_csr_cmd_during_port_transfer(self):
+        cmds, data, results = self.block_transfer_test(count=2, timeout=True, csr_cmd=13)
+        self.assertEqual(cmds, [SDCARD_CMD_READ_MULTIPLE_BLOCK, SDCARD_CMD_STOP_TRANSMISSION, 13])
+        self.assertEqual(results["csr_done"], 1)
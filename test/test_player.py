@@ -0,0 +1,111 @@
+#
+# This file is part of LiteSDCard.
+#
+# Copyright (c) 2026 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litex.gen import *
+
+from litesdcard.core import SDCore
+from litesdcard.frontend.player import SDStreamPlayer
+
+from test.test_core import StubPHY, cmdw_generator, cmdr_generator, datar_generator
+
+# DUT ----------------------------------------------------------------------------------------------
+
+class DUT(LiteXModule):
+    def __init__(self):
+        self.phy    = StubPHY()
+        self.core   = SDCore(self.phy)
+        self.player = SDStreamPlayer(self.core, fifo_depth=1024)
+
+# Test Player --------------------------------------------------------------------------------------
+
+class TestPlayer(unittest.TestCase):
+    def player_test(self, count, loop=0, period=0, nbytes=None, stop=False, timeout=False,
+        timeout_cycles=8192):
+        cmds    = []
+        data    = []
+        results = {}
+        def main_generator(dut):
+            player = dut.player
+            yield player.lba.storage.eq(0x100)
+            yield player.count.storage.eq(count)
+            yield player.loop.storage.eq(loop)
+            yield player.period.storage.eq(period)
+            yield player.source.ready.eq(1)
+            yield player.start.re.eq(1)
+            yield
+            yield player.start.re.eq(0)
+            yield
+            # Receive nbytes (or until the player stops).
+            cycles = 0
+            while (nbytes is None) or (len(data) < nbytes):
+                if (yield player.source.valid):
+                    data.append(((yield player.source.data), (yield player.source.last), cycles))
+                if (nbytes is None) and not (yield player.status.fields.running):
+                    if not (yield player.source.valid):
+                        break
+                cycles += 1
+                if cycles > timeout_cycles:
+                    raise TimeoutError("Player output timeout.")
+                yield
+            # Stop and check the FIFO has been flushed.
+            if stop:
+                yield player.source.ready.eq(0)
+                yield player.stop.re.eq(1)
+                yield
+                yield player.stop.re.eq(0)
+                for i in range(timeout_cycles):
+                    if not (yield player.status.fields.running):
+                        break
+                    yield
+                for i in range(8):
+                    yield
+                results["valid_after_stop"] = (yield player.source.valid)
+            results["running"] = (yield player.status.fields.running)
+            results["error"]   = (yield player.status.fields.error)
+            results["passes"]  = (yield player.passes.status)
+
+        dut = DUT()
+        generators = [
+            main_generator(dut),
+            cmdw_generator(dut.phy, cmds),
+            cmdr_generator(dut.phy),
+            datar_generator(dut.phy, timeout=timeout),
+        ]
+        run_simulation(dut, generators)
+        return cmds, data, results
+
+    def test_single_pass(self):
+        cmds, data, results = self.player_test(count=2)
+        self.assertEqual(len(data), 2*512)
+        self.assertEqual([d for d, l, c in data[:512]], [i & 0xff for i in range(512)])
+        self.assertEqual([i for i, (d, l, c) in enumerate(data) if l], [2*512 - 1])
+        self.assertEqual(results["running"], 0)
+        self.assertEqual(results["error"],   0)
+        self.assertEqual(results["passes"],  1)
+
+    def test_loop_and_stop(self):
+        cmds, data, results = self.player_test(count=1, loop=1, nbytes=2*512 + 16, stop=True)
+        self.assertEqual([i for i, (d, l, c) in enumerate(data) if l], [512 - 1, 2*512 - 1])
+        self.assertGreaterEqual(results["passes"], 2)
+        self.assertEqual(results["running"], 0)
+        self.assertEqual(results["valid_after_stop"], 0)
+
+    def test_rate_limit(self):
+        cmds, data, results = self.player_test(count=1, period=3, nbytes=16, stop=True)
+        cycles = [c for d, l, c in data]
+        self.assertTrue(all((b - a) >= 4 for a, b in zip(cycles, cycles[1:])))
+        self.assertEqual(results["valid_after_stop"], 0)
+
+    def test_read_error(self):
+        cmds, data, results = self.player_test(count=4, loop=1, timeout=True)
+        self.assertEqual(data, [])
+        self.assertEqual(results["running"], 0)
+        self.assertEqual(results["error"],   1)
+        self.assertEqual(results["passes"],  0)
@@ -0,0 +1,151 @@
+#
+# This file is part of LiteSDCard.
+#
+# Copyright (c) 2026 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litesdcard.common import *
+from litesdcard.stripe import SDStripingCore
+
+from test.test_core import StubPHY, cmdw_generator, cmdr_generator, datar_generator, dataw_generator
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def card_pattern(card):
+    # Constant per block: card in bits 4-7, block index of the card transfer in bits 0-3.
+    return lambda block, i: (card << 4) | block
+
+def start_transfer(dut, lba, count, write):
+    yield dut.lba.storage.eq(lba)
+    yield dut.count.storage.eq(count)
+    yield dut.write.storage.eq(write)
+    yield dut.start.re.eq(1)
+    yield
+    yield dut.start.re.eq(0)
+    yield
+    yield
+
+def wait_done(dut, timeout_cycles):
+    for i in range(timeout_cycles):
+        if (yield dut.status.fields.done):
+            return
+        yield
+    raise TimeoutError("Striped transfer not done.")
+
+# Test Stripe --------------------------------------------------------------------------------------
+
+class TestStripe(unittest.TestCase):
+    def stripe_test(self, main_generator, n=2, timeouts=[]):
+        dut  = SDStripingCore([StubPHY() for i in range(n)], fifo_depth=1024)
+        cmds = [[] for i in range(n)]
+        args = [[] for i in range(n)]
+        data = [[] for i in range(n)]
+        generators = [main_generator(dut)]
+        for i in range(n):
+            phy = getattr(dut, f"phy{i}")
+            generators += [
+                cmdw_generator(phy, cmds[i], args[i]),
+                cmdr_generator(phy),
+                datar_generator(phy, timeout=(i in timeouts), pattern=card_pattern(i)),
+                dataw_generator(phy, data[i]),
+            ]
+        run_simulation(dut, generators)
+        return cmds, args, data
+
+    def test_read_unaligned(self):
+        results = {}
+        def main_generator(dut):
+            received = []
+            yield from start_transfer(dut, lba=1, count=3, write=0)
+            yield dut.source.ready.eq(1)
+            for i in range(8192):
+                if (yield dut.source.valid):
+                    received.append(((yield dut.source.data), (yield dut.source.first), (yield dut.source.last)))
+                if (yield dut.status.fields.done):
+                    break
+                yield
+            results["received"] = received
+            results["error"]    = (yield dut.status.fields.error)
+        cmds, args, data = self.stripe_test(main_generator)
+        # LBA split: logical 1, 3 -> card 1 LBAs 0, 1; logical 2 -> card 0 LBA 1.
+        self.assertEqual(cmds[0], [SDCARD_CMD_READ_SINGLE_BLOCK])
+        self.assertEqual(args[0], [1])
+        self.assertEqual(cmds[1], [SDCARD_CMD_READ_MULTIPLE_BLOCK, SDCARD_CMD_STOP_TRANSMISSION])
+        self.assertEqual(args[1][0], 0)
+        # Gather in logical order.
+        received = results["received"]
+        self.assertEqual(len(received), 3*512)
+        self.assertEqual([d for d, f, l in received[::512]], [0x10, 0x00, 0x11])
+        self.assertEqual([i for i, (d, f, l) in enumerate(received) if f], [0, 512, 1024])
+        self.assertEqual([i for i, (d, f, l) in enumerate(received) if l], [511, 1023, 1535])
+        self.assertEqual(results["error"], 0)
+
+    def test_write_fanout(self):
+        def main_generator(dut):
+            yield from start_transfer(dut, lba=3, count=3, write=1)
+            for i in range(3*512):
+                yield dut.sink.valid.eq(1)
+                yield dut.sink.data.eq(i//512)
+                yield
+                while not (yield dut.sink.ready):
+                    yield
+            yield dut.sink.valid.eq(0)
+            yield from wait_done(dut, 8192)
+            self.assertEqual((yield dut.status.fields.error), 0)
+        cmds, args, data = self.stripe_test(main_generator)
+        # Logical 3, 5 -> card 1 LBAs 1, 2; logical 4 -> card 0 LBA 2.
+        self.assertEqual(cmds[0], [SDCARD_CMD_WRITE_SINGLE_BLOCK])
+        self.assertEqual(args[0], [2])
+        self.assertEqual(cmds[1], [SDCARD_CMD_WRITE_MULTIPLE_BLOCK, SDCARD_CMD_STOP_TRANSMISSION])
+        self.assertEqual(args[1][0], 1)
+        self.assertEqual(data[0], [1]*512)
+        self.assertEqual(data[1], [0]*512 + [2]*512)
+
+    def test_card_error(self):
+        def main_generator(dut):
+            yield from start_transfer(dut, lba=0, count=4, write=0)
+            yield dut.source.ready.eq(1)
+            yield from wait_done(dut, 8192)
+            self.assertEqual((yield dut.errors.status), 0b10)
+            self.assertEqual((yield dut.status.fields.error), 1)
+            # A new transfer can be started.
+            yield dut.source.ready.eq(0)
+            yield from start_transfer(dut, lba=0, count=1, write=0)
+            self.assertEqual((yield dut.status.fields.done), 0)
+            self.assertEqual((yield dut.status.fields.error), 0)
+        cmds, args, data = self.stripe_test(main_generator, timeouts=[1])
+
+    def test_abort(self):
+        def main_generator(dut):
+            yield from start_transfer(dut, lba=0, count=4, write=1)
+            for i in range(256):
+                yield dut.sink.valid.eq(1)
+                yield dut.sink.data.eq(0xa5)
+                yield
+                while not (yield dut.sink.ready):
+                    yield
+            yield dut.sink.valid.eq(0)
+            yield dut.abort.re.eq(1)
+            yield
+            yield dut.abort.re.eq(0)
+            yield from wait_done(dut, 8192)
+            self.assertEqual((yield dut.status.fields.error), 1)
+            self.assertEqual((yield dut.errors.status), 0)
+        cmds, args, data = self.stripe_test(main_generator)
+        # Blocks are completed with zeroes.
+        self.assertEqual(data[0], [0xa5]*256 + [0]*(512 + 256))
+        self.assertEqual(data[1], [0]*(2*512))
+
+    def test_sel(self):
+        def main_generator(dut):
+            yield dut.sel.storage.eq(1)
+            yield dut.sink.valid.eq(1)
+            yield
+            yield
+            self.assertEqual((yield dut.core0.sink.valid), 0)
+            self.assertEqual((yield dut.core1.sink.valid), 1)
+        self.stripe_test(main_generator)